@@ -17,13 +17,112 @@ Example:
 
 import sys
 import os
+import io
 import zipfile
 import argparse
 import hashlib
 import re
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import repeat
 from pathlib import Path
 from datetime import datetime
 
+import yaml
+
+# Intel ISA-L's DEFLATE is SIMD-accelerated and emits the same raw DEFLATE
+# stream as zlib; use it when python-isal is installed
+try:
+    from isal import isal_zlib
+except ImportError:
+    isal_zlib = None
+
+# zlib-ng computes CRC-32 with PCLMULQDQ folding rather than zlib's table
+# lookups; use it when the zlib-ng package is installed
+try:
+    from zlib_ng.zlib_ng import crc32
+except ImportError:
+    from zlib import crc32
+
+# Prefer PyYAML's libyaml-backed C loader when it was built with libyaml
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
+# Frontmatter and version patterns, compiled once at import time
+_FRONTMATTER_RE = re.compile(r'^---\n(.*?)\n---', re.DOTALL)
+_NAME_RE = re.compile(r'^[a-z0-9-]+$')
+_SEMVER_RE = re.compile(r'^\d+\.\d+\.\d+$')
+_PLACEHOLDER_RE = re.compile(
+    r'\{\{(SKILL_NAME|SKILL_VERSION|SKILL_DESCRIPTION|INSTALLATION_DATE|SKILL_DIR_NAME)\}\}'
+)
+
+# Files and directories left out of packages
+_EXCLUDE_NAMES = frozenset({
+    '.DS_Store', '.gitignore', 'Thumbs.db',
+    '__pycache__', '.git', '.vscode', '.idea',
+})
+_EXCLUDE_SUFFIXES = ('.pyc', '.pyo', '.swp', '.swo', '~')
+_EXCLUDE_DIR_RE = re.compile(r'(?:^|[\\/])(?:__pycache__|\.git|\.vscode|\.idea)(?:[\\/]|$)')
+
+# Extensions whose contents are already compressed; deflating them again
+# costs CPU for little or no size gain, so they are stored as-is
+_PRECOMPRESSED_EXTENSIONS = frozenset({
+    '.zip', '.gz', '.tgz', '.bz2', '.xz', '.whl',
+    '.png', '.jpg', '.jpeg', '.gif', '.webp',
+    '.woff', '.woff2',
+})
+
+# Below this much input, worker process startup costs more than it saves
+_PARALLEL_MIN_BYTES = 4 * 1024 * 1024
+
+
+@lru_cache(maxsize=None)
+def read_frontmatter(skill_md, mtime_ns):
+    """
+    Read the raw YAML frontmatter block of a SKILL.md file.
+
+    Cached per path and modification time, so an unchanged file is only
+    read once per run.
+
+    Args:
+        skill_md: Path to the SKILL.md file
+        mtime_ns: Modification time of the file, part of the cache key
+
+    Returns:
+        tuple: (frontmatter: str or None, error: str or None)
+    """
+    content = Path(skill_md).read_text()
+    if not content.startswith('---'):
+        return None, "No YAML frontmatter found"
+
+    match = _FRONTMATTER_RE.match(content)
+    if not match:
+        return None, "Invalid frontmatter format"
+
+    return match.group(1), None
+
+
+def parse_frontmatter(frontmatter):
+    """
+    Parse a frontmatter block into a dictionary with PyYAML.
+
+    Args:
+        frontmatter: Raw frontmatter text between the --- delimiters
+
+    Returns:
+        tuple: (fields: dict or None, error: str or None)
+    """
+    try:
+        fields = yaml.load(frontmatter, Loader=_YAML_LOADER)
+    except yaml.YAMLError as exc:
+        return None, f"Invalid YAML in frontmatter: {exc}"
+
+    if not isinstance(fields, dict):
+        return None, "Frontmatter must be a YAML mapping"
+
+    return fields, None
+
 
 def validate_skill_extended(skill_path):
     """
@@ -39,60 +138,45 @@ def validate_skill_extended(skill_path):
     if not skill_md.exists():
         return False, "SKILL.md not found", {}
 
-    # Read and validate frontmatter
-    content = skill_md.read_text()
-    if not content.startswith('---'):
-        return False, "No YAML frontmatter found", {}
+    # Read and parse frontmatter
+    frontmatter, error = read_frontmatter(skill_md, skill_md.stat().st_mtime_ns)
+    if error:
+        return False, error, {}
 
-    # Extract frontmatter
-    match = re.match(r'^---\n(.*?)\n---', content, re.DOTALL)
-    if not match:
-        return False, "Invalid frontmatter format", {}
-
-    frontmatter = match.group(1)
+    fields, error = parse_frontmatter(frontmatter)
+    if error:
+        return False, error, {}
 
     # Check required fields
-    if 'name:' not in frontmatter:
+    name = fields.get('name')
+    description = fields.get('description')
+    if not name:
         return False, "Missing 'name' in frontmatter", {}
-    if 'description:' not in frontmatter:
+    if not description:
         return False, "Missing 'description' in frontmatter", {}
 
-    metadata = {}
-
-    # Extract name
-    name_match = re.search(r'name:\s*(.+)', frontmatter)
-    if name_match:
-        name = name_match.group(1).strip()
-        metadata['name'] = name
-
-        # Check naming convention
-        if not re.match(r'^[a-z0-9-]+$', name):
-            return False, f"Name '{name}' should be hyphen-case", {}
-        if name.startswith('-') or name.endswith('-') or '--' in name:
-            return False, f"Name '{name}' has invalid hyphen placement", {}
-
-    # Extract description
-    desc_match = re.search(r'description:\s*(.+)', frontmatter)
-    if desc_match:
-        description = desc_match.group(1).strip()
-        metadata['description'] = description
-
-        # Check for angle brackets
-        if '<' in description or '>' in description:
-            return False, "Description cannot contain angle brackets", {}
-
-    # Extract version (optional, will be added if missing)
-    version_match = re.search(r'version:\s*(.+)', frontmatter)
-    if version_match:
-        version = version_match.group(1).strip()
-        metadata['version'] = version
-    else:
-        metadata['version'] = None
+    # Check naming convention
+    if not isinstance(name, str) or not _NAME_RE.fullmatch(name):
+        return False, f"Name '{name}' should be hyphen-case", {}
+    if name.startswith('-') or name.endswith('-') or '--' in name:
+        return False, f"Name '{name}' has invalid hyphen placement", {}
+
+    # Check description type and angle brackets
+    if not isinstance(description, str):
+        return False, "Description must be a string", {}
+    description = description.strip()
+    if '<' in description or '>' in description:
+        return False, "Description cannot contain angle brackets", {}
 
-    # Extract license if present
-    license_match = re.search(r'license:\s*(.+)', frontmatter)
-    if license_match:
-        metadata['license'] = license_match.group(1).strip()
+    metadata = {'name': name, 'description': description}
+
+    # Version is optional, will be added if missing
+    version = fields.get('version')
+    metadata['version'] = str(version) if version is not None else None
+
+    # License if present
+    if fields.get('license') is not None:
+        metadata['license'] = str(fields['license'])
 
     return True, "Skill is valid!", metadata
 
@@ -107,17 +191,52 @@ def validate_semver(version):
     Returns:
         bool: True if valid semver format
     """
-    pattern = r'^\d+\.\d+\.\d+$'
-    return re.match(pattern, version) is not None
+    return _SEMVER_RE.match(version) is not None
+
+
+class HashingWriter(io.RawIOBase):
+    """
+    Write-only stream that feeds every byte through SHA-256 on its way
+    to the underlying file.
+
+    The stream is deliberately not seekable, so zipfile writes each entry
+    strictly front to back (using data descriptors instead of patching
+    local headers) and the digest matches the finished archive without
+    reading it back from disk.
+    """
 
+    def __init__(self, f):
+        self.f = f
+        self.h = hashlib.sha256()
 
-def calculate_file_hash(file_path):
-    """Calculate SHA-256 hash of a file."""
-    sha256_hash = hashlib.sha256()
-    with open(file_path, "rb") as f:
-        for byte_block in iter(lambda: f.read(4096), b""):
-            sha256_hash.update(byte_block)
-    return sha256_hash.hexdigest()
+    def writable(self):
+        return True
+
+    def write(self, b):
+        self.h.update(b)
+        return self.f.write(b)
+
+
+def walk_files(root):
+    """
+    Recursively yield an os.DirEntry for every file under a directory.
+
+    DirEntry objects carry the file type from the directory listing, so
+    telling files from directories costs no extra stat call. Symlinked
+    directories are not followed.
+
+    Args:
+        root: Directory to walk
+
+    Yields:
+        os.DirEntry: One entry per file
+    """
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from walk_files(entry.path)
+            elif entry.is_file():
+                yield entry
 
 
 def should_exclude_file(file_path):
@@ -130,41 +249,134 @@ def should_exclude_file(file_path):
     Returns:
         bool: True if file should be excluded
     """
-    exclude_patterns = [
-        '.DS_Store',
-        '__pycache__',
-        '*.pyc',
-        '*.pyo',
-        '.git',
-        '.gitignore',
-        'Thumbs.db',
-        '.vscode',
-        '.idea',
-        '*.swp',
-        '*.swo',
-        '*~'
-    ]
-
     file_name = file_path.name
+    return (
+        file_name in _EXCLUDE_NAMES
+        or file_name.endswith(_EXCLUDE_SUFFIXES)
+        or _EXCLUDE_DIR_RE.search(str(file_path)) is not None
+    )
 
-    # Check exact matches
-    if file_name in exclude_patterns:
-        return True
 
-    # Check pattern matches
-    for pattern in exclude_patterns:
-        if pattern.startswith('*.'):
-            extension = pattern[1:]
-            if file_name.endswith(extension):
-                return True
-
-    # Check if in excluded directory
-    parts = file_path.parts
-    excluded_dirs = {'__pycache__', '.git', '.vscode', '.idea'}
-    if any(part in excluded_dirs for part in parts):
-        return True
+def is_precompressed(file_path):
+    """
+    Determine if a file's contents are already compressed.
+
+    Args:
+        file_path: Path object of the file
+
+    Returns:
+        bool: True if the file should be stored without recompression
+    """
+    return file_path.suffix.lower() in _PRECOMPRESSED_EXTENSIONS
+
+
+def deflate(data, compresslevel):
+    """
+    Compress data to a raw DEFLATE stream as stored in ZIP entries.
+
+    Args:
+        data: Bytes to compress
+        compresslevel: zlib-style level 1-9
+
+    Returns:
+        bytes: Raw DEFLATE data (no zlib header or trailer)
+    """
+    if isal_zlib is not None and compresslevel <= 3:
+        # ISA-L only has levels 0-3, none of which compress as well as
+        # zlib's higher levels, so it handles zlib's 1-3 as ISA-L 0-2 and
+        # zlib is kept for 4-9
+        compressor = isal_zlib.compressobj(compresslevel - 1, isal_zlib.DEFLATED, -15)
+    else:
+        compressor = zlib.compressobj(compresslevel, zlib.DEFLATED, -15)
+    return compressor.compress(data) + compressor.flush()
+
+
+def compress_file(file_path, compresslevel):
+    """
+    Read a file and compress it the way it will be stored in the package.
+
+    Args:
+        file_path: Path object of the file
+        compresslevel: DEFLATE level 0-9 (0 stores the file uncompressed)
+
+    Returns:
+        tuple: (compress_type: int, crc: int, file_size: int, payload: bytes)
+    """
+    data = file_path.read_bytes()
+    crc = crc32(data)
+    if compresslevel == 0 or is_precompressed(file_path):
+        return zipfile.ZIP_STORED, crc, len(data), data
+    return zipfile.ZIP_DEFLATED, crc, len(data), deflate(data, compresslevel)
+
+
+def compress_files(file_paths, total_size, compresslevel, jobs=None):
+    """
+    Compress files with compress_file, using worker processes for large inputs.
+
+    Args:
+        file_paths: List of Path objects to compress
+        total_size: Combined size of the files in bytes
+        compresslevel: DEFLATE level 0-9
+        jobs: Number of worker processes (None for one per CPU, 1 to disable)
 
-    return False
+    Yields:
+        tuple: compress_file results, in the same order as file_paths
+    """
+    if jobs == 1 or len(file_paths) < 2 or total_size < _PARALLEL_MIN_BYTES:
+        for file_path in file_paths:
+            yield compress_file(file_path, compresslevel)
+        return
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        yield from executor.map(compress_file, file_paths, repeat(compresslevel))
+
+
+def write_compressed_entry(zipf, zinfo, payload):
+    """
+    Append an entry whose data has already been compressed to an open ZipFile.
+
+    zipfile has no public API for this, so the local header and data are
+    written directly and the entry is registered for the central directory
+    the same way ZipFile.writestr does internally. This relies on private
+    ZipFile attributes and is verified against CPython 3.11's zipfile.
+
+    Args:
+        zipf: ZipFile opened for writing
+        zinfo: ZipInfo with compress_type, CRC, file_size and compress_size set
+        payload: Entry data exactly as it should appear in the archive
+    """
+    if not zipf.fp:
+        raise ValueError(
+            "Attempt to write to ZIP archive that was already closed")
+    if zipf._writing:
+        raise ValueError(
+            "Can't write to ZIP archive while an open writing handle exists.")
+
+    zip64 = max(zinfo.file_size, zinfo.compress_size) > zipfile.ZIP64_LIMIT
+    with zipf._lock:
+        zipf._writecheck(zinfo)
+        zipf._didModify = True
+        zinfo.header_offset = zipf.fp.tell()
+        zipf.fp.write(zinfo.FileHeader(zip64))
+        zipf.fp.write(payload)
+        zipf.start_dir = zipf.fp.tell()
+        zipf.filelist.append(zinfo)
+        zipf.NameToInfo[zinfo.filename] = zinfo
+
+
+@lru_cache(maxsize=None)
+def read_template(template_path, mtime_ns):
+    """
+    Read a template file, cached per path and modification time.
+
+    Args:
+        template_path: Path to the template file
+        mtime_ns: Modification time of the file, part of the cache key
+
+    Returns:
+        str: Raw template content
+    """
+    return Path(template_path).read_text()
 
 
 def load_template(template_path, skill_metadata, version, skill_dir_name):
@@ -183,26 +395,23 @@ def load_template(template_path, skill_metadata, version, skill_dir_name):
     if not template_path.exists():
         return None
 
-    template_content = template_path.read_text()
+    template_content = read_template(template_path, template_path.stat().st_mtime_ns)
 
     # Prepare substitution variables
     substitutions = {
-        '{{SKILL_NAME}}': skill_metadata.get('name', 'Unknown'),
-        '{{SKILL_VERSION}}': version,
-        '{{SKILL_DESCRIPTION}}': skill_metadata.get('description', 'No description'),
-        '{{INSTALLATION_DATE}}': datetime.now().strftime('%Y-%m-%d'),
-        '{{SKILL_DIR_NAME}}': skill_dir_name,
+        'SKILL_NAME': skill_metadata.get('name', 'Unknown'),
+        'SKILL_VERSION': version,
+        'SKILL_DESCRIPTION': skill_metadata.get('description', 'No description'),
+        'INSTALLATION_DATE': datetime.now().strftime('%Y-%m-%d'),
+        'SKILL_DIR_NAME': skill_dir_name,
     }
 
-    # Perform substitutions
-    result = template_content
-    for placeholder, value in substitutions.items():
-        result = result.replace(placeholder, value)
-
-    return result
+    # Perform all substitutions in a single pass
+    return _PLACEHOLDER_RE.sub(lambda m: substitutions[m.group(1)], template_content)
 
 
-def create_package(skill_path, version, output_dir):
+def create_package(skill_path, version, output_dir, compresslevel=1, jobs=None,
+                   verbose=False):
     """
     Create a versioned ZIP package of the skill.
 
@@ -210,6 +419,9 @@ def create_package(skill_path, version, output_dir):
         skill_path: Path to the skill directory
         version: Version string for the package
         output_dir: Directory where package will be created
+        compresslevel: DEFLATE level 0-9 (0 stores files uncompressed)
+        jobs: Number of compression worker processes (None for one per CPU)
+        verbose: List every file added to the package
 
     Returns:
         tuple: (success: bool, zip_path: Path or None, metadata: dict)
@@ -248,24 +460,50 @@ def create_package(skill_path, version, output_dir):
     try:
         file_count = 0
         total_size = 0
-
-        with zipfile.ZipFile(zip_filename, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            # Walk through the skill directory
-            for file_path in skill_path.rglob('*'):
-                if file_path.is_file() and not should_exclude_file(file_path):
-                    # Calculate the relative path within the zip
-                    arcname = file_path.relative_to(skill_path.parent)
-                    zipf.write(file_path, arcname)
-
-                    file_size = file_path.stat().st_size
-                    total_size += file_size
-                    file_count += 1
-
-                    print(f"   Added: {arcname} ({file_size:,} bytes)")
-
-        # Calculate package size and hash
+        added = []
+
+        # Walk through the skill directory, keeping each file's stat result
+        # for its ZIP metadata
+        file_paths = []
+        file_stats = []
+        for entry in walk_files(skill_path):
+            file_path = Path(entry.path)
+            if not should_exclude_file(file_path):
+                file_stat = entry.stat()
+                file_paths.append(file_path)
+                file_stats.append(file_stat)
+                total_size += file_stat.st_size
+
+        # Files are compressed independently (possibly in parallel), then
+        # appended to the archive in walk order
+        with open(zip_filename, 'wb') as raw, HashingWriter(raw) as hw, \
+                zipfile.ZipFile(hw, 'w') as zipf:
+            compressed = compress_files(file_paths, total_size, compresslevel, jobs)
+            for file_path, file_stat, result in zip(file_paths, file_stats, compressed):
+                compress_type, crc, file_size, payload = result
+
+                # Calculate the relative path within the zip
+                arcname = file_path.relative_to(skill_path.parent)
+                date_time = datetime.fromtimestamp(file_stat.st_mtime).timetuple()[:6]
+                zinfo = zipfile.ZipInfo(str(arcname), date_time)
+                zinfo.external_attr = (file_stat.st_mode & 0xFFFF) << 16
+                zinfo.compress_type = compress_type
+                zinfo.CRC = crc
+                zinfo.file_size = file_size
+                zinfo.compress_size = len(payload)
+                write_compressed_entry(zipf, zinfo, payload)
+                file_count += 1
+
+                if verbose:
+                    added.append(f"   Added: {arcname} ({file_size:,} bytes)")
+
+        # Emit the file listing in one write rather than per file
+        if added:
+            sys.stdout.write('\n'.join(added) + '\n')
+
+        # Package hash was computed while writing
         package_size = zip_filename.stat().st_size
-        package_hash = calculate_file_hash(zip_filename)
+        package_hash = hw.h.hexdigest()
 
         print()
         print(f"✅ Package created successfully!")
@@ -354,6 +592,17 @@ def generate_documentation(skill_path, version, output_dir, metadata):
     return len(doc_paths) > 0, doc_paths
 
 
+def positive_int(value):
+    """argparse type for options that must be a whole number of at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Package a skill with versioning and documentation'
@@ -373,6 +622,26 @@ def main():
         required=True,
         help='Directory where package and docs will be created'
     )
+    parser.add_argument(
+        '--compresslevel',
+        type=int,
+        default=1,
+        choices=range(0, 10),
+        metavar='{0-9}',
+        help='DEFLATE compression level; 1 is fastest, 9 smallest, 0 stores. '
+             'With isal installed, levels 1-3 use ISA-L (default: 1)'
+    )
+    parser.add_argument(
+        '--jobs',
+        type=positive_int,
+        default=None,
+        help='Number of compression worker processes (default: one per CPU)'
+    )
+    parser.add_argument(
+        '--verbose',
+        action='store_true',
+        help='List every file added to the package'
+    )
 
     args = parser.parse_args()
 
@@ -385,7 +654,10 @@ def main():
     success, zip_path, metadata = create_package(
         args.skill_path,
         args.version,
-        args.output_dir
+        args.output_dir,
+        compresslevel=args.compresslevel,
+        jobs=args.jobs,
+        verbose=args.verbose
     )
 
     if not success:
@@ -8,12 +8,40 @@ This script performs static analysis to detect common WCAG 2.1 AA violations.
 import re
 import sys
 import json
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Tuple
-from dataclasses import dataclass, asdict
+from typing import List, Dict, Tuple, Optional, Iterator
+from dataclasses import dataclass, fields
 
 
-@dataclass
+# Below this many files, worker process startup costs more than it saves
+_PARALLEL_MIN_FILES = 32
+
+# Substrings at least one of which must appear on a line for any HTML or
+# React rule to fire there, as (needle, case_insensitive)
+_HTML_NEEDLES = (
+    ('<img', True),
+    ('<button', True),
+    ('onclick=', True),
+    ('tabindex=', True),
+)
+_REACT_NEEDLES = (
+    ('<img', False),
+    ('onclick=', True),
+    ('role="button"', False),
+    ("role='button'", False),
+    ('aria-expanded=', False),
+    ('<label', False),
+    ('autofocus', True),
+    ('tabIndex=', False),
+)
+
+
+# dataclass(slots=True) needs Python 3.10+
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_SLOTS)
 class Issue:
     """Represents an accessibility issue found in code."""
     file: str
@@ -25,12 +53,35 @@ class Issue:
     code_snippet: str
 
 
+# Issue is flat, so JSON output reads attributes directly rather than
+# paying for dataclasses.asdict's recursive deep copy
+_ISSUE_FIELDS = tuple(f.name for f in fields(Issue))
+
+
 class WCAGChecker:
     """Checks code for WCAG 2.1 AA compliance issues."""
     
+    # Compiled on first use and shared by all instances and files
+    _patterns: Optional[Dict[str, re.Pattern]] = None
+    
     def __init__(self):
         self.issues: List[Issue] = []
     
+    @classmethod
+    def _get_patterns(cls) -> Dict[str, re.Pattern]:
+        """Return the compiled rule patterns, compiling them on first call."""
+        if cls._patterns is None:
+            cls._patterns = {
+                'tabindex_html': re.compile(r'tabindex=["\']?(\d+)'),
+                'tabindex_jsx': re.compile(r'tabIndex={?(\d+)}?'),
+                'button_content': re.compile(r'<button[^>]*>(.*?)</button>', re.IGNORECASE),
+                'html_tag': re.compile(r'<html[^>]*>', re.IGNORECASE),
+                'aria_expanded': re.compile(r'aria-expanded=["\']?(true|false|{)'),
+                'color_hex': re.compile(r'color:\s*#([0-9a-f]{3,6})'),
+                'bg_hex': re.compile(r'background(?:-color)?:\s*#([0-9a-f]{3,6})'),
+            }
+        return cls._patterns
+    
     def check_file(self, filepath: str) -> List[Issue]:
         """Check a single file for accessibility issues."""
         self.issues = []
@@ -41,15 +92,14 @@ class WCAGChecker:
             return []
         
         content = path.read_text(encoding='utf-8')
-        lines = content.split('\n')
         
         # Determine file type
         if path.suffix in ['.html', '.htm']:
-            self._check_html(lines, filepath)
+            self._check_html(content, filepath)
         elif path.suffix in ['.tsx', '.jsx', '.ts', '.js']:
-            self._check_react(lines, filepath)
+            self._check_react(content, filepath)
         elif path.suffix == '.css':
-            self._check_css(lines, filepath)
+            self._check_css(content, filepath)
         
         return self.issues
     
@@ -65,11 +115,72 @@ class WCAGChecker:
             code_snippet=snippet.strip()
         ))
     
-    def _check_html(self, lines: List[str], filepath: str):
+    def _candidate_lines(self, content: str, needles: Tuple[Tuple[str, bool], ...]) -> Iterator[Tuple[int, str]]:
+        """
+        Yield (line_number, line) for each line containing at least one needle.
+        
+        Needles are located with str.find over the whole document, so lines
+        that cannot trigger any rule are skipped without per-line work.
+        """
+        content_lower = None
+        positions = []
+        for needle, ignore_case in needles:
+            if ignore_case:
+                if content_lower is None:
+                    content_lower = content.lower()
+                    if len(content_lower) != len(content):
+                        # Some characters lowercase to several, so offsets
+                        # would not line up; fall back to every line
+                        yield from _iter_lines(content)
+                        return
+                haystack = content_lower
+            else:
+                haystack = content
+            pos = haystack.find(needle)
+            while pos != -1:
+                positions.append(pos)
+                pos = haystack.find(needle, pos + len(needle))
+        
+        # Walk hits in document order, counting newlines between them
+        positions.sort()
+        line_num = 1
+        line_start = 0
+        line_end = -1
+        for pos in positions:
+            if pos < line_end:
+                continue  # Same line as the previous hit
+            start = content.rfind('\n', 0, pos) + 1
+            line_num += content.count('\n', line_start, start)
+            line_start = start
+            line_end = content.find('\n', pos)
+            if line_end == -1:
+                line_end = len(content)
+            yield line_num, content[start:line_end]
+    
+    def _check_html(self, content: str, filepath: str):
         """Check HTML files for accessibility issues."""
-        for i, line in enumerate(lines, 1):
+        p = self._get_patterns()
+        
+        # Check for lang attribute on html tag (a document has only one);
+        # the issue is held back so issues are still reported in line order
+        lang_issue = None
+        html_tag = p['html_tag'].search(content)
+        if html_tag and 'lang=' not in html_tag.group(0).lower():
+            start = content.rfind('\n', 0, html_tag.start()) + 1
+            end = content.find('\n', html_tag.start())
+            lang_issue = (
+                filepath, content.count('\n', 0, start) + 1, 'error', 'html-lang',
+                'HTML element missing lang attribute (WCAG 3.1.1)',
+                content[start:end if end != -1 else len(content)]
+            )
+        
+        for i, line in self._candidate_lines(content, _HTML_NEEDLES):
             line_lower = line.lower()
             
+            if lang_issue and lang_issue[1] < i:
+                self._add_issue(*lang_issue)
+                lang_issue = None
+            
             # Check for images without alt text
             if '<img' in line_lower and 'alt=' not in line_lower:
                 self._add_issue(
@@ -87,7 +198,7 @@ class WCAGChecker:
             # Check for buttons without accessible name
             if '<button' in line_lower and '>' in line:
                 # Extract content between tags
-                content = re.search(r'<button[^>]*>(.*?)</button>', line, re.IGNORECASE)
+                content = p['button_content'].search(line)
                 if content and not content.group(1).strip():
                     if 'aria-label=' not in line_lower:
                         self._add_issue(
@@ -96,14 +207,9 @@ class WCAGChecker:
                             line
                         )
             
-            # Check for lang attribute on html tag
-            if i == 1 or '<html' in line_lower:
-                if '<html' in line_lower and 'lang=' not in line_lower:
-                    self._add_issue(
-                        filepath, i, 'error', 'html-lang',
-                        'HTML element missing lang attribute (WCAG 3.1.1)',
-                        line
-                    )
+            if lang_issue and lang_issue[1] == i:
+                self._add_issue(*lang_issue)
+                lang_issue = None
             
             # Check for click handlers on non-interactive elements
             if 'onclick=' in line_lower:
@@ -116,17 +222,22 @@ class WCAGChecker:
                         )
             
             # Check for tabindex > 0
-            tabindex_match = re.search(r'tabindex=["\']?(\d+)', line_lower)
-            if tabindex_match and int(tabindex_match.group(1)) > 0:
-                self._add_issue(
-                    filepath, i, 'warning', 'no-positive-tabindex',
-                    'Positive tabindex values can cause focus order issues',
-                    line
-                )
+            if 'tabindex=' in line_lower:
+                tabindex_match = p['tabindex_html'].search(line_lower)
+                if tabindex_match and int(tabindex_match.group(1)) > 0:
+                    self._add_issue(
+                        filepath, i, 'warning', 'no-positive-tabindex',
+                        'Positive tabindex values can cause focus order issues',
+                        line
+                    )
+        
+        if lang_issue:
+            self._add_issue(*lang_issue)
     
-    def _check_react(self, lines: List[str], filepath: str):
+    def _check_react(self, content: str, filepath: str):
         """Check React/TypeScript files for accessibility issues."""
-        for i, line in enumerate(lines, 1):
+        p = self._get_patterns()
+        for i, line in self._candidate_lines(content, _REACT_NEEDLES):
             line_lower = line.lower()
             
             # Check for img without alt
@@ -158,8 +269,7 @@ class WCAGChecker:
                     )
             
             # Check for aria-expanded not being boolean
-            aria_expanded = re.search(r'aria-expanded=["\']?(true|false|{)', line)
-            if 'aria-expanded=' in line and not aria_expanded:
+            if 'aria-expanded=' in line and not p['aria_expanded'].search(line):
                 self._add_issue(
                     filepath, i, 'error', 'aria-expanded-invalid',
                     'aria-expanded must be "true" or "false" or boolean expression',
@@ -185,23 +295,26 @@ class WCAGChecker:
                 )
             
             # Check for tabIndex > 0
-            tabindex_match = re.search(r'tabIndex={?(\d+)}?', line)
-            if tabindex_match and int(tabindex_match.group(1)) > 0:
-                self._add_issue(
-                    filepath, i, 'warning', 'no-positive-tabindex',
-                    'Positive tabIndex values can cause focus order issues',
-                    line
-                )
+            if 'tabIndex=' in line:
+                tabindex_match = p['tabindex_jsx'].search(line)
+                if tabindex_match and int(tabindex_match.group(1)) > 0:
+                    self._add_issue(
+                        filepath, i, 'warning', 'no-positive-tabindex',
+                        'Positive tabIndex values can cause focus order issues',
+                        line
+                    )
     
-    def _check_css(self, lines: List[str], filepath: str):
+    def _check_css(self, content: str, filepath: str):
         """Check CSS files for accessibility issues."""
-        for i, line in enumerate(lines, 1):
-            line_lower = line.strip().lower()
+        p = self._get_patterns()
+        prev_lower = ''
+        for i, line in _iter_lines(content):
+            line_lower = line.lower()
             
             # Check for outline: none without alternative focus indicator
             if 'outline:' in line_lower and 'none' in line_lower:
                 # Check if it's on :focus
-                if ':focus' in line_lower or i > 1 and ':focus' in lines[i-2].lower():
+                if ':focus' in line_lower or ':focus' in prev_lower:
                     self._add_issue(
                         filepath, i, 'warning', 'focus-visible',
                         'Removing outline on :focus requires alternative visible focus indicator (WCAG 2.4.7)',
@@ -210,8 +323,8 @@ class WCAGChecker:
             
             # Check for potential color contrast issues (basic heuristic)
             # This is a simplified check - full contrast checking requires color analysis
-            color_match = re.search(r'color:\s*#([0-9a-f]{3,6})', line_lower)
-            bg_match = re.search(r'background(?:-color)?:\s*#([0-9a-f]{3,6})', line_lower)
+            color_match = p['color_hex'].search(line_lower) if 'color:' in line_lower else None
+            bg_match = p['bg_hex'].search(line_lower) if color_match else None
             
             if color_match and bg_match:
                 # Light colors on light backgrounds or dark on dark might be issues
@@ -223,6 +336,8 @@ class WCAGChecker:
                         'Potential color contrast issue - verify 4.5:1 ratio for text (WCAG 1.4.3)',
                         line
                     )
+            
+            prev_lower = line_lower
     
     def _similar_lightness(self, color1: str, color2: str) -> bool:
         """Simple heuristic to check if two colors might have similar lightness."""
@@ -243,10 +358,32 @@ class WCAGChecker:
         return (l1 > 180 and l2 > 180) or (l1 < 75 and l2 < 75)
 
 
+def _iter_lines(text: str) -> Iterator[Tuple[int, str]]:
+    """Yield (line_number, line) lazily, without building a list of all lines."""
+    start = 0
+    line_num = 1
+    length = len(text)
+    while start <= length:
+        end = text.find('\n', start)
+        if end == -1:
+            end = length
+        yield line_num, text[start:end]
+        start = end + 1
+        line_num += 1
+
+
+def _check_one(filepath: str) -> List[Issue]:
+    """Check one file with a fresh checker (used by worker processes)."""
+    return WCAGChecker().check_file(filepath)
+
+
 def format_output(issues: List[Issue], format: str = 'text') -> str:
     """Format issues for output."""
     if format == 'json':
-        return json.dumps([asdict(issue) for issue in issues], indent=2)
+        return json.dumps(
+            [{name: getattr(issue, name) for name in _ISSUE_FIELDS} for issue in issues],
+            indent=2
+        )
     
     # Text format
     output = []
@@ -294,12 +431,18 @@ def main():
     files = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
     format_json = '--json' in sys.argv
     
-    checker = WCAGChecker()
     all_issues = []
     
-    for filepath in files:
-        issues = checker.check_file(filepath)
-        all_issues.extend(issues)
+    # Files are independent, so large batches are spread across processes
+    if len(files) < _PARALLEL_MIN_FILES:
+        checker = WCAGChecker()
+        for filepath in files:
+            issues = checker.check_file(filepath)
+            all_issues.extend(issues)
+    else:
+        with ProcessPoolExecutor() as executor:
+            for issues in executor.map(_check_one, files, chunksize=16):
+                all_issues.extend(issues)
     
     output_format = 'json' if format_json else 'text'
     print(format_output(all_issues, output_format))